@@ -1,76 +1,585 @@
 import os
 import json
+import locale
+import mmap
+import stat
+import sys
 import argparse
-from pathlib import Path
-from tkinter import *
-from tkinter import ttk, filedialog, messagebox
-from typing import Dict, Any
+import queue
+import threading
+from collections import defaultdict, deque
+from functools import cache, partial
+from importlib import import_module
+from itertools import groupby
+from types import MappingProxyType
+from typing import Dict, Any, Callable, List, Optional, Set, Tuple
+
+# Tkinter loads Tcl/Tk, so it is only imported once the GUI is requested
+tk = ttk = filedialog = messagebox = None
+
+def _lazy_tk():
+    """Import the Tkinter modules used by the designer"""
+    global tk, ttk, filedialog, messagebox
+    import tkinter as tk
+    from tkinter import ttk, filedialog, messagebox
+
+# Manifests larger than this are streamed instead of loaded whole. Streamed
+# manifests are not validated up front: an unsupported value such as an
+# array raises ValueError only when it is reached, leaving the part of the
+# tree created before it on disk.
+STREAM_THRESHOLD = 8 * 1024 * 1024
+
+# Below this size the stdlib json module parses a manifest faster than
+# orjson can be imported
+ORJSON_THRESHOLD = 1024 * 1024
+
+@cache
+def _optional_module(name: str):
+    """Import an optional dependency on first use, or return None if it is missing"""
+    try:
+        return import_module(name)
+    except ImportError:
+        return None
+
+def _intern_pairs(cache: Dict[str, str], pairs):
+    """JSON object hook that shares repeated names and short file contents
+
+    Bind cache with functools.partial; it should live for one load only.
+    """
+    return {
+        sys.intern(k): (cache.setdefault(v, v) if isinstance(v, str) and len(v) < 64 else v)
+        for k, v in pairs
+    }
+
+def _load_manifest(json_path: str) -> Any:
+    """Parse and validate a JSON manifest, through a read-only memory map when possible"""
+    with open(json_path, 'rb') as f:
+        info = os.fstat(f.fileno())
+        if stat.S_ISREG(info.st_mode) and info.st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                structure = _parse_manifest(mm)
+        else:  # Pipes and empty files cannot be mapped
+            structure = _parse_manifest(f.read())
+    return structure
+
+def _parse_manifest(data) -> Any:
+    """Parse and validate manifest bytes, or a buffer such as an mmap"""
+    orjson = _optional_module('orjson') if len(data) >= ORJSON_THRESHOLD else None
+    if orjson is not None:  # Parses the buffer without copying it
+        with memoryview(data) as view:
+            structure = orjson.loads(view)
+        # orjson shares repeated keys itself but not values, so those are
+        # shared while validating rather than in a walk of their own
+        _validate_structure(structure, {})
+    else:
+        structure = json.loads(bytes(data), object_pairs_hook=partial(_intern_pairs, {}))
+        _validate_structure(structure)
+    return structure
+
+# JSON scalar types that become file contents
+_FILE_TYPES = {str, int, float, bool}
+
+def _validate_structure(structure: Any, cache: Optional[Dict[str, str]] = None):
+    """Check that directories are objects or null and files are scalars,
+    de-duplicating short string values through cache when one is given"""
+    if structure is None or type(structure) is str:  # Empty or root level file
+        return
+    stack = [("", structure)]
+    while stack:
+        path, node = stack.pop()
+        if type(node) is not dict:
+            raise ValueError(f"Expected an object at {path or 'the top level'}")
+        for name, value in node.items():
+            if type(value) is dict:
+                stack.append((os.path.join(path, name), value))
+            elif type(value) is str:
+                if cache is not None and len(value) < 64:
+                    node[name] = cache.setdefault(value, value)
+            elif value is not None and type(value) not in _FILE_TYPES:
+                raise ValueError(f"Unsupported value for {os.path.join(path, name)}: {type(value).__name__}")
+
+def _dump_manifest(structure: Any, json_path: str):
+    """Write a structure as an indented JSON manifest"""
+    orjson = _optional_module('orjson')
+    if orjson is not None:
+        with open(json_path, 'wb') as f:
+            f.write(orjson.dumps(structure, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(structure, f, indent=2, ensure_ascii=False)
+
+# Sample book_recommender structure shown when the designer starts
+_SAMPLE_STRUCTURE = MappingProxyType({
+    "book_recommender": {
+        "app": {
+            "__init__.py": "",
+            "main.py": (
+                "# FastAPI app setup\n"
+                "from fastapi import FastAPI\n"
+                "from .routes import router\n\n"
+                "app = FastAPI()\n"
+                "app.include_router(router)\n\n"
+                "@app.get('/')\n"
+                "def read_root():\n"
+                "    return {'message': 'Welcome to Book Recommender API'}"
+            ),
+            "routes.py": (
+                "# API endpoints\n"
+                "from fastapi import APIRouter\n"
+                "from .schemas import BookQuery\n"
+                "from .services.recommendation_service import recommend_books\n\n"
+                "router = APIRouter()\n\n"
+                "@router.post('/recommend')\n"
+                "def get_recommendations(query: BookQuery):\n"
+                "    return recommend_books(query)"
+            ),
+            "schemas.py": (
+                "# Pydantic models\n"
+                "from pydantic import BaseModel\n\n"
+                "class BookQuery(BaseModel):\n"
+                "    genre: str\n"
+                "    author: str = None\n"
+                "    min_rating: float = 0.0"
+            ),
+            "services": {
+                "__init__.py": "",
+                "book_service.py": "# Logic related to books",
+                "recommendation_service.py": (
+                    "# Recommendation logic\n"
+                    "def recommend_books(query):\n"
+                    "    # Dummy logic\n"
+                    "    return {'recommendations': ['Book A', 'Book B']}"
+                ),
+            },
+            "data": {
+                "__init__.py": "",
+                "data_loader.py": "# Functions for loading book data",
+                "books.csv": (
+                    "book_id,title,author,genre,rating\n"
+                    "1,1984,George Orwell,Dystopian,4.6\n"
+                    "2,Dune,Frank Herbert,Science Fiction,4.5"
+                ),
+            },
+        },
+        "requirements.txt": "fastapi\nuvicorn\npydantic\npandas",
+        "README.md": "# Book Recommender\n\nA FastAPI-based book recommendation system.",
+    }
+})
+
+# Stands in for a nested object in FlatStructure.entries
+_OBJECT = object()
+
+class FlatStructure:
+    """Project structure as flat lists of paths relative to the project root"""
+    def __init__(self):
+        self.dirs: List[str] = []  # Parents before children
+        self.files: List[Tuple[str, Optional[str]]] = []  # (path, content)
+        self.display: List[str] = []  # Tree labels for dirs, then files
+        # The manifest as loaded, for saving it back unchanged: one
+        # (parent entry index or -1, key, value) per key in manifest order,
+        # with _OBJECT as the value of nested objects
+        self.entries: List[Tuple[int, str, Any]] = []
+        self.root: Any = _OBJECT  # What a manifest that is not an object held
+
+def _flatten(structure: Any, trusted: bool = False, for_view: bool = False) -> FlatStructure:
+    """Convert a nested structure dict into a FlatStructure
+
+    trusted marks a structure checked by _validate_structure, whose
+    directories are known to be plain dicts; it is then classified with
+    exact type checks instead of isinstance. display and entries are only
+    filled in for_view, as the designer needs them and generation does not.
+    """
+    flat = FlatStructure()
+    file_labels = []
+    known = set()
+    join = os.path.join
+    todo = deque()
+    if type(structure) is dict if trusted else isinstance(structure, dict):
+        todo.append(("", structure, -1))
+    else:
+        flat.root = structure
+        if structure is not None:  # Root level file
+            flat.files.append((structure, None))
+            if for_view:
+                file_labels.append(f"📄 {structure}")
+    while todo:  # Breadth-first, so parents are listed before children
+        base, content, parent = todo.popleft()
+        if content is None:  # Empty directory
+            continue
+        for name, subcontent in content.items():
+            is_dir = type(subcontent) is dict if trusted else isinstance(subcontent, dict)
+            index = len(flat.entries)
+            if for_view:
+                flat.entries.append((parent, name, _OBJECT if is_dir else subcontent))
+            path = join(base, name)
+            # Names like "app/core" imply the intermediate directories
+            parts = name.split("/")
+            for i in range(1, len(parts)):
+                middle = join(base, *parts[:i])
+                if middle not in known:
+                    known.add(middle)
+                    flat.dirs.append(middle)
+                    if for_view:
+                        flat.display.append(f"📁 {parts[i - 1]}")
+            if is_dir or subcontent is None:
+                if path not in known:
+                    known.add(path)
+                    flat.dirs.append(path)
+                    if for_view:
+                        flat.display.append(f"📁 {parts[-1]}")
+                todo.append((path, subcontent, index))
+            else:  # File with content
+                flat.files.append((path, str(subcontent)))
+                if for_view:
+                    file_labels.append(f"📄 {parts[-1]}")
+    flat.display.extend(file_labels)
+    return flat
+
+def _unflatten(flat: FlatStructure) -> Any:
+    """Rebuild the manifest a FlatStructure was flattened from"""
+    if flat.root is not _OBJECT:
+        return flat.root
+    objects: Dict[int, Dict[str, Any]] = {-1: {}}
+    for index, (parent, name, value) in enumerate(flat.entries):
+        if value is _OBJECT:
+            value = objects[index] = {}
+        objects[parent][name] = value
+    return objects[-1]
+
+def _encode_text(content: str) -> bytes:
+    """Encode file content the way open(path, 'w') would"""
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    return content.encode(locale.getpreferredencoding(False))
+
+# Depth levels with fewer directories than this are created inline
+PARALLEL_MKDIR_LEVEL = 64
+
+# Trees with at most this many directories and files are written inline,
+# without starting an event loop
+INLINE_TREE_SIZE = 64
+
+# Files per worker call when writing a directory's files
+WRITE_CHUNK_SIZE = 32
 
 class ProjectGenerator:
     @staticmethod
-    def create_from_json(json_path: str, target_dir: str):
+    def create_from_json(json_path: str, target_dir: str, verbose: bool = False, via_tar: bool = False):
         """Create project structure from JSON file"""
-        with open(json_path) as f:
-            structure = json.load(f)
-        ProjectGenerator.create_structure(target_dir, structure)
+        if via_tar:
+            ProjectGenerator.create_structure_via_tar(target_dir, _flatten(_load_manifest(json_path), trusted=True), verbose)
+            return
+        if os.path.getsize(json_path) > STREAM_THRESHOLD and _optional_module('ijson') is not None:
+            ProjectGenerator._create_streaming(json_path, target_dir, verbose)
+            return
+        structure = _flatten(_load_manifest(json_path), trusted=True)
+        ProjectGenerator.create_structure(target_dir, structure, verbose)
     
     @staticmethod
-    def create_structure(base_dir: str, structure: Dict[str, Any]):
-        """Create project structure from dictionary"""
-        base_path = Path(base_dir)
-        
-        def _create(base: Path, content: Any):
-            if isinstance(content, dict):  # Directory
-                for name, subcontent in content.items():
-                    path = base / name
-                    if isinstance(subcontent, dict) or subcontent is None:
-                        path.mkdir(parents=True, exist_ok=True)
+    def _create_streaming(json_path: str, target_dir: str, verbose: bool = False):
+        """Create project structure directly from ijson parse events"""
+        if target_dir:  # An empty target is the current directory
+            os.makedirs(target_dir, exist_ok=True)
+        seen = {target_dir}
+        stack = [target_dir]
+        key = None
+        with open(json_path, 'rb') as f:
+            for prefix, event, value in _optional_module('ijson').parse(f, use_float=True):
+                if event == 'map_key':
+                    key = value
+                elif event == 'start_map':
+                    if key is not None:  # Directory
+                        path = os.path.join(stack[-1], key)
+                        ProjectGenerator._ensure_dir(path, seen)
+                        if verbose:
+                            print(f"Created directory: {path}")
+                        stack.append(path)
+                elif event == 'end_map':
+                    stack.pop()
+                elif event == 'null':  # Empty directory
+                    if key is None:  # A null manifest creates nothing
+                        continue
+                    path = os.path.join(stack[-1], key)
+                    ProjectGenerator._ensure_dir(path, seen)
+                    if verbose:
                         print(f"Created directory: {path}")
-                        _create(path, subcontent)
+                elif event in ('string', 'number', 'boolean'):
+                    if key is None:  # Root level file
+                        if event != 'string':
+                            raise ValueError("Expected an object at the top level")
+                        path = os.path.join(target_dir, value)
+                        ProjectGenerator._write_file(path, None)
                     else:  # File with content
-                        with open(path, 'w') as f:
-                            f.write(str(subcontent))
+                        path = os.path.join(stack[-1], key)
+                        if "/" in key:  # Names like "app/main.py" imply directories
+                            ProjectGenerator._ensure_dir(os.path.dirname(path), seen)
+                        ProjectGenerator._write_file(path, str(value))
+                    if verbose:
                         print(f"Created file: {path}")
-            elif content is not None:  # Root level file
-                path = base / content
-                path.touch()
-                print(f"Created file: {path}")
+                elif event == 'start_array':
+                    raise ValueError(f"Arrays are not supported in project structures: {prefix}")
+        print(f"\nProject structure created successfully at {target_dir}")
+    
+    @staticmethod
+    def create_structure(base_dir: str, structure: Any, verbose: bool = False,
+                         progress: Optional[Callable[[int, int], None]] = None):
+        """Create project structure from dictionary"""
+        if not isinstance(structure, FlatStructure):
+            structure = _flatten(structure)
+        if len(structure.dirs) + len(structure.files) <= INLINE_TREE_SIZE:
+            ProjectGenerator._create_inline(base_dir, structure, verbose, progress)
+            return
+        import asyncio  # Costs more to import than small trees take to write
+        asyncio.run(ProjectGenerator.create_structure_async(base_dir, structure, verbose, progress))
+
+    @staticmethod
+    def _create_inline(base_dir: str, structure: FlatStructure, verbose: bool = False,
+                       progress: Optional[Callable[[int, int], None]] = None):
+        """Create a small project structure on the calling thread"""
+        join = os.path.join
+        dirs = [join(base_dir, path) for path in structure.dirs]
+        files = [(join(base_dir, path), content) for path, content in structure.files]
+        
+        if base_dir:  # An empty base is the current directory
+            os.makedirs(base_dir, exist_ok=True)
+        seen = {base_dir}
+        for path in dirs:
+            ProjectGenerator._ensure_dir(path, seen)
+        
+        total = len(dirs) + len(files)
+        done = len(dirs)
+        if progress is not None:
+            progress(done, total)
+        for path, content in files:
+            ProjectGenerator._write_file(path, content)
+            done += 1
+            if progress is not None:
+                progress(done, total)
+        
+        ProjectGenerator._report(base_dir, dirs, files, verbose)
+
+    @staticmethod
+    async def create_structure_async(base_dir: str, structure: Any, verbose: bool = False,
+                                     progress: Optional[Callable[[int, int], None]] = None):
+        """Create project structure from dictionary or FlatStructure, overlapping file writes
+
+        progress, if given, is called as progress(done, total) with the number
+        of directories and files created so far.
+        """
+        import asyncio
         
-        _create(base_path, structure)
-        print(f"\nProject structure created successfully at {base_path}")
+        if not isinstance(structure, FlatStructure):
+            structure = _flatten(structure)
+        join = os.path.join
+        dirs = [join(base_dir, path) for path in structure.dirs]
+        files = [(join(base_dir, path), content) for path, content in structure.files]
+        
+        total = len(dirs) + len(files)
+        done = len(dirs)
+        
+        # One worker hop per chunk of a directory's files, opened relative to
+        # it; large directories are split so their writes still overlap
+        groups = defaultdict(list)
+        for path, content in files:
+            directory, name = os.path.split(path)
+            groups[directory].append((name, content))
+        chunks = [
+            (directory, entries[start:start + WRITE_CHUNK_SIZE])
+            for directory, entries in groups.items()
+            for start in range(0, len(entries), WRITE_CHUNK_SIZE)
+        ]
+        
+        async def write(directory, entries):
+            nonlocal done
+            await asyncio.to_thread(ProjectGenerator._write_files, directory, entries)
+            done += len(entries)
+            if progress is not None:
+                progress(done, total)
+        
+        await ProjectGenerator._make_dirs(base_dir, dirs)
+        if progress is not None:
+            progress(done, total)
+        
+        # Directories exist now, so file writes can overlap
+        await asyncio.gather(*(write(directory, entries) for directory, entries in chunks))
+        
+        ProjectGenerator._report(base_dir, dirs, files, verbose)
+
+    @staticmethod
+    def _report(base_dir: str, dirs: List[str], files: List[Tuple[str, Optional[str]]], verbose: bool):
+        """Print the creation listing, if asked for, and the summary line"""
+        if verbose:  # One write for the whole listing
+            messages = [f"Created directory: {path}\n" for path in dirs]
+            messages.extend(f"Created file: {path}\n" for path, _ in files)
+            sys.stdout.write("".join(messages))
+        
+        print(f"\nProject structure created successfully at {base_dir}")
+
+    @staticmethod
+    def create_structure_via_tar(base_dir: str, structure: Any, verbose: bool = False):
+        """Create project structure by extracting an in-memory tar archive
+
+        Useful on network filesystems, where one sequential extraction beats
+        many individual file operations.
+        """
+        import tarfile  # Only this writer needs it, so keep it off startup
+        import time
+        from io import BytesIO
+
+        if not isinstance(structure, FlatStructure):
+            structure = _flatten(structure)
+        # Without extraction filters the archive's modes are applied, so
+        # bake the umask into them to match the other writers
+        umask = 0
+        if not hasattr(tarfile, 'data_filter'):
+            umask = os.umask(0)
+            os.umask(umask)
+        buffer = BytesIO()
+        now = time.time()
+        touched = []
+        with tarfile.open(fileobj=buffer, mode='w') as tar:
+            for path in structure.dirs:
+                info = tarfile.TarInfo(path)
+                info.type = tarfile.DIRTYPE
+                info.mode = 0o777 & ~umask
+                info.mtime = now
+                tar.addfile(info)
+            for path, content in structure.files:
+                if content is None:  # Touched below rather than truncated
+                    touched.append(path)
+                    continue
+                data = _encode_text(content)
+                info = tarfile.TarInfo(path)
+                info.size = len(data)
+                info.mode = 0o666 & ~umask
+                info.mtime = now
+                tar.addfile(info, BytesIO(data))
+        
+        buffer.seek(0)
+        if base_dir:  # An empty base is the current directory
+            os.makedirs(base_dir, exist_ok=True)
+        with tarfile.open(fileobj=buffer, mode='r') as tar:
+            if hasattr(tarfile, 'data_filter'):
+                # Refuses paths outside base_dir; a mode of None leaves
+                # permissions to the umask
+                tar.extractall(base_dir, filter=lambda member, dest: (
+                    tarfile.data_filter(member, dest).replace(mode=None, deep=False)
+                ))
+            else:
+                tar.extractall(base_dir)
+        for path in touched:
+            ProjectGenerator._write_file(os.path.join(base_dir, path), None)
+        
+        if verbose:
+            join = os.path.join
+            messages = [f"Created directory: {join(base_dir, path)}\n" for path in structure.dirs]
+            messages.extend(f"Created file: {join(base_dir, path)}\n" for path, _ in structure.files)
+            sys.stdout.write("".join(messages))
+        
+        print(f"\nProject structure created successfully at {base_dir}")
+
+    @staticmethod
+    async def _make_dirs(base_dir: str, dirs: List[str]):
+        """Create directories one depth level at a time, each level concurrently"""
+        if base_dir:  # An empty base is the current directory
+            os.makedirs(base_dir, exist_ok=True)
+        seen = {base_dir}
+        # dirs lists parents first and a level only depends on the one above
+        for _, level in groupby(dirs, key=lambda p: p.count(os.sep)):
+            level = list(level)
+            if len(level) < PARALLEL_MKDIR_LEVEL:  # A thread hop costs more than mkdir
+                for path in level:
+                    ProjectGenerator._ensure_dir(path, seen)
+                continue
+            import asyncio
+            await asyncio.gather(*(
+                asyncio.to_thread(ProjectGenerator._ensure_dir, path, seen)
+                for path in level
+            ))
+
+    @staticmethod
+    def _ensure_dir(path: str, seen: Set[str]):
+        """Create path, skipping the existence checks for parents in seen"""
+        if path in seen:
+            return
+        if os.path.dirname(path) in seen:
+            try:
+                os.mkdir(path)
+            except FileExistsError:
+                if not os.path.isdir(path):
+                    raise
+        else:
+            os.makedirs(path, exist_ok=True)
+        seen.add(path)
+
+    @staticmethod
+    def _write_files(directory: str, entries: List[Tuple[str, Optional[str]]]):
+        """Write the files of one directory, resolving the directory only once"""
+        directory = directory or "."
+        if os.open not in os.supports_dir_fd:
+            for name, content in entries:
+                ProjectGenerator._write_file(os.path.join(directory, name), content)
+            return
+        dir_fd = os.open(directory, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+        try:
+            for name, content in entries:
+                ProjectGenerator._write_file(name, content, dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    @staticmethod
+    def _write_file(path: str, content: Optional[str], dir_fd: Optional[int] = None):
+        """Write a single file; content None only touches it"""
+        if content is None:
+            os.close(os.open(path, os.O_WRONLY | os.O_CREAT, 0o666, dir_fd=dir_fd))
+            return
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666, dir_fd=dir_fd)
+        try:
+            data = memoryview(_encode_text(content))
+            while data:  # os.write may write less than it was given
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
 
 class ProjectDesigner:
     def __init__(self, root):
+        _lazy_tk()
         self.root = root
         self.root.title("Project Structure Designer")
         self.root.geometry("1000x700")
         
-        self.project_structure = {}
+        self.project_structure = FlatStructure()
         self.current_path = []
+        self._children = {}  # Directory path -> [(text, path, is_dir)]
+        self._node_index = {}  # (path, is_dir) -> tree node id
+        self._loaded = {""}  # Directory paths whose children are in the tree
+        self._pending = {}  # Tree node id -> directory path not yet inserted
         
         self.setup_ui()
         self.load_sample_structure()
         
     def setup_ui(self):
         # Main frames
-        control_frame = Frame(self.root, padx=10, pady=10, width=300)
-        control_frame.pack(side=LEFT, fill=Y)
+        control_frame = tk.Frame(self.root, padx=10, pady=10, width=300)
+        control_frame.pack(side=tk.LEFT, fill=tk.Y)
         
-        self.tree_frame = Frame(self.root, padx=10, pady=10)
-        self.tree_frame.pack(side=RIGHT, expand=True, fill=BOTH)
+        self.tree_frame = tk.Frame(self.root, padx=10, pady=10)
+        self.tree_frame.pack(side=tk.RIGHT, expand=True, fill=tk.BOTH)
         
         # Control panel
-        Label(control_frame, text="Project Designer", font=('Arial', 14)).pack(pady=10)
+        tk.Label(control_frame, text="Project Designer", font=('Arial', 14)).pack(pady=10)
         
-        Button(control_frame, text="Load JSON", command=self.load_json).pack(fill=X, pady=5)
-        Button(control_frame, text="Save JSON", command=self.save_json).pack(fill=X, pady=5)
-        Button(control_frame, text="Generate Project", command=self.generate_project).pack(fill=X, pady=20)
+        tk.Button(control_frame, text="Load JSON", command=self.load_json).pack(fill=tk.X, pady=5)
+        tk.Button(control_frame, text="Save JSON", command=self.save_json).pack(fill=tk.X, pady=5)
+        self.generate_button = tk.Button(control_frame, text="Generate Project", command=self.generate_project)
+        self.generate_button.pack(fill=tk.X, pady=20)
         
         # Structure display
         self.tree = ttk.Treeview(self.tree_frame)
         vsb = ttk.Scrollbar(self.tree_frame, orient="vertical", command=self.tree.yview)
         hsb = ttk.Scrollbar(self.tree_frame, orient="horizontal", command=self.tree.xview)
         self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.tree.bind("<<TreeviewOpen>>", self._on_open)
         
         self.tree.grid(row=0, column=0, sticky="nsew")
         vsb.grid(row=0, column=1, sticky="ns")
@@ -80,15 +589,14 @@ class ProjectDesigner:
         self.tree_frame.grid_columnconfigure(0, weight=1)
         
         # Status bar
-        self.status = Label(self.root, text="Ready", bd=1, relief=SUNKEN, anchor=W)
-        self.status.pack(side=BOTTOM, fill=X)
+        self.status = tk.Label(self.root, text="Ready", bd=1, relief=tk.SUNKEN, anchor=tk.W)
+        self.status.pack(side=tk.BOTTOM, fill=tk.X)
         
     def load_json(self):
         file_path = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
         if file_path:
             try:
-                with open(file_path) as f:
-                    self.project_structure = json.load(f)
+                self.project_structure = _flatten(_load_manifest(file_path), trusted=True, for_view=True)
                 self.update_tree_view()
                 self.status.config(text=f"Loaded structure from: {file_path}")
             except Exception as e:
@@ -100,91 +608,143 @@ class ProjectDesigner:
             filetypes=[("JSON files", "*.json")]
         )
         if file_path:
-            with open(file_path, 'w') as f:
-                json.dump(self.project_structure, f, indent=4)
+            _dump_manifest(_unflatten(self.project_structure), file_path)
             self.status.config(text=f"Structure saved to: {file_path}")
     
     def generate_project(self):
         target_dir = filedialog.askdirectory()
         if target_dir:
+            self.status.config(text=f"Generating project at: {target_dir}")
+            self.generate_button.config(state=tk.DISABLED)  # One writer at a time
+            events = queue.Queue()
+            threading.Thread(
+                target=self._do_generate,
+                args=(target_dir, self.project_structure, events),
+                daemon=True,
+            ).start()
+            self.root.after(100, self._poll_generate, target_dir, events)
+    
+    def _do_generate(self, target_dir, structure, events):
+        # Runs off the Tk thread, so it only talks to the UI through events
+        try:
+            ProjectGenerator.create_structure(
+                target_dir, structure, verbose=False,
+                progress=lambda done, total: events.put(("progress", done, total)),
+            )
+        except Exception as e:
+            events.put(("error", f"Failed to create project:\n{str(e)}", None))
+        else:
+            events.put(("done", None, None))
+    
+    def _poll_generate(self, target_dir, events):
+        while True:
             try:
-                ProjectGenerator.create_structure(target_dir, self.project_structure)
-                messagebox.showinfo("Success", f"Project generated at:\n{target_dir}")
+                kind, first, second = events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                self.status.config(text=f"Generating project at: {target_dir} ({first}/{second})")
+            elif kind == "error":
+                self.generate_button.config(state=tk.NORMAL)
+                self.status.config(text=f"Failed to create project at: {target_dir}")
+                messagebox.showerror("Error", first)
+                return
+            else:
+                self.generate_button.config(state=tk.NORMAL)
                 self.status.config(text=f"Project created at: {target_dir}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to create project:\n{str(e)}")
+                messagebox.showinfo("Success", f"Project generated at:\n{target_dir}")
+                return
+        self.root.after(100, self._poll_generate, target_dir, events)
     
     def update_tree_view(self):
-        self.tree.delete(*self.tree.get_children())
-        self._add_tree_node("", self.project_structure)
-    
-    def _add_tree_node(self, parent, structure):
-        if isinstance(structure, dict):
-            for name, content in structure.items():
-                if isinstance(content, dict):
-                    node = self.tree.insert(parent, "end", text=f"📁 {name}", open=True)
-                    self._add_tree_node(node, content)
-                else:
-                    self.tree.insert(parent, "end", text=f"📄 {name}")
+        structure = self.project_structure
+        labels = iter(structure.display)
+        children = defaultdict(list)
+        for path, text in zip(structure.dirs, labels):
+            children[os.path.dirname(path)].append((text, path, True))
+        for (path, _), text in zip(structure.files, labels):
+            children[os.path.dirname(path)].append((text, path, False))
+        self._children = children
+        
+        # Reconcile only the nodes already in the tree; unopened directories
+        # read self._children when they are expanded
+        wanted = {(path, is_dir) for rows in children.values() for _, path, is_dir in rows}
+        self.tree.grid_remove()
+        try:
+            for key in [key for key in self._node_index if key not in wanted]:
+                node = self._node_index.pop(key, None)
+                if node is None:  # Already deleted along with an ancestor
+                    continue
+                self.tree.delete(node)
+                self._forget(key[0], node)
+                prefix = os.path.join(key[0], "")
+                for sub in [sub for sub in self._node_index if sub[0].startswith(prefix)]:
+                    self._forget(sub[0], self._node_index.pop(sub))
+            for path in list(self._loaded):
+                parent = "" if path == "" else self._node_index[(path, True)]
+                order = list(self.tree.get_children(parent))
+                for index, row in enumerate(children.get(path, ())):
+                    node = self._node_index.get((row[1], row[2]))
+                    if node is None:
+                        order.insert(index, self._insert_row(parent, index, row))
+                        continue
+                    if order[index] != node:  # Keys were reordered
+                        self.tree.move(node, parent, index)
+                        order.remove(node)
+                        order.insert(index, node)
+                    if row[2]:
+                        self._set_expander(node, row[1])
+        finally:
+            self.tree.grid()
+    
+    def _forget(self, path, node):
+        self._pending.pop(node, None)
+        self._loaded.discard(path)
+    
+    def _add_tree_node(self, parent, path):
+        # Only one level is inserted; subdirectories get a placeholder child
+        # so they show an expander and are filled in when first opened
+        self._insert_batch(parent, self._children.get(path, ()))
+        self._loaded.add(path)
+    
+    def _insert_batch(self, parent, rows):
+        """Insert sibling rows with the tree taken out of the layout"""
+        self.tree.grid_remove()
+        try:
+            for row in rows:
+                self._insert_row(parent, "end", row)
+        finally:
+            self.tree.grid()
+    
+    def _insert_row(self, parent, index, row):
+        text, path, is_dir = row
+        node = self.tree.insert(parent, index, text=text)
+        self._node_index[(path, is_dir)] = node
+        if is_dir:
+            self._set_expander(node, path)
+        return node
+    
+    def _set_expander(self, node, path):
+        # Unopened directories with children hold a placeholder child
+        if path in self._children:
+            if node not in self._pending and path not in self._loaded:
+                self.tree.insert(node, "end", text="")
+                self._pending[node] = path
+        else:  # Empty, so there is nothing to fill in later
+            if self._pending.pop(node, None) is not None:
+                self.tree.delete(*self.tree.get_children(node))
+            self._loaded.add(path)
+    
+    def _on_open(self, event):
+        node = self.tree.focus()
+        path = self._pending.pop(node, None)
+        if path is not None:
+            self.tree.delete(*self.tree.get_children(node))
+            self._add_tree_node(node, path)
     
     def load_sample_structure(self):
         """Load the sample book_recommender structure"""
-        self.project_structure = {
-            "book_recommender": {
-                "app": {
-                    "__init__.py": "",
-                    "main.py": (
-                        "# FastAPI app setup\n"
-                        "from fastapi import FastAPI\n"
-                        "from .routes import router\n\n"
-                        "app = FastAPI()\n"
-                        "app.include_router(router)\n\n"
-                        "@app.get('/')\n"
-                        "def read_root():\n"
-                        "    return {'message': 'Welcome to Book Recommender API'}"
-                    ),
-                    "routes.py": (
-                        "# API endpoints\n"
-                        "from fastapi import APIRouter\n"
-                        "from .schemas import BookQuery\n"
-                        "from .services.recommendation_service import recommend_books\n\n"
-                        "router = APIRouter()\n\n"
-                        "@router.post('/recommend')\n"
-                        "def get_recommendations(query: BookQuery):\n"
-                        "    return recommend_books(query)"
-                    ),
-                    "schemas.py": (
-                        "# Pydantic models\n"
-                        "from pydantic import BaseModel\n\n"
-                        "class BookQuery(BaseModel):\n"
-                        "    genre: str\n"
-                        "    author: str = None\n"
-                        "    min_rating: float = 0.0"
-                    ),
-                    "services": {
-                        "__init__.py": "",
-                        "book_service.py": "# Logic related to books",
-                        "recommendation_service.py": (
-                            "# Recommendation logic\n"
-                            "def recommend_books(query):\n"
-                            "    # Dummy logic\n"
-                            "    return {'recommendations': ['Book A', 'Book B']}"
-                        ),
-                    },
-                    "data": {
-                        "__init__.py": "",
-                        "data_loader.py": "# Functions for loading book data",
-                        "books.csv": (
-                            "book_id,title,author,genre,rating\n"
-                            "1,1984,George Orwell,Dystopian,4.6\n"
-                            "2,Dune,Frank Herbert,Science Fiction,4.5"
-                        ),
-                    },
-                },
-                "requirements.txt": "fastapi\nuvicorn\npydantic\npandas",
-                "README.md": "# Book Recommender\n\nA FastAPI-based book recommendation system.",
-            }
-        }
+        self.project_structure = _flatten(dict(_SAMPLE_STRUCTURE), trusted=True, for_view=True)
         self.update_tree_view()
         self.status.config(text="Loaded sample book_recommender structure")
 
@@ -194,15 +754,18 @@ def main():
     parser.add_argument('--json', help='JSON file containing project structure')
     parser.add_argument('--output', default='.', help='Output directory for generated project')
     parser.add_argument('--gui', action='store_true', help='Launch GUI designer')
+    parser.add_argument('--verbose', action='store_true', help='List every created directory and file')
+    parser.add_argument('--tar', action='store_true', help='Write the project by extracting an in-memory tar archive')
     
     args = parser.parse_args()
     
     if args.gui:
-        root = Tk()
+        _lazy_tk()
+        root = tk.Tk()
         app = ProjectDesigner(root)
         root.mainloop()
     elif args.json:
-        ProjectGenerator.create_from_json(args.json, args.output)
+        ProjectGenerator.create_from_json(args.json, args.output, verbose=args.verbose, via_tar=args.tar)
     else:
         print("Please specify either --gui or --json argument")
         parser.print_help()